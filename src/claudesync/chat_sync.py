@@ -2,13 +2,35 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from tqdm import tqdm
 
+from .config_manager import DEFAULT_CHAT_SYNC_WORKERS
 from .exceptions import ConfigurationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Matches opening <antArtifact> tags, capturing their identifier and type
+ARTIFACT_START_PATTERN = re.compile(
+    r'<antArtifact\s+identifier="(?P<identifier>[^"]+)"\s+type="(?P<type>[^"]+)"\s+title="[^"]+">'
+)
+ARTIFACT_END_TAG = "</antArtifact>"
+
+# File extensions for the known artifact MIME types
+ARTIFACT_FILE_EXTENSIONS = {
+    "text/html": "html",
+    "application/vnd.ant.code": "txt",
+    "image/svg+xml": "svg",
+    "application/vnd.ant.mermaid": "mmd",
+    "application/vnd.ant.react": "jsx",
+}
+
 
 def sync_chats(provider, config, sync_all=False):
     """
@@ -17,6 +39,12 @@ def sync_chats(provider, config, sync_all=False):
     This function fetches all chats for the active organization, saves their metadata,
     messages, and extracts any artifacts found in the assistant's messages.
 
+    If `chat_sync_durable` is set, every file written for a chat is fsynced, and the chat
+    folder is flushed before and after its metadata is written. This is one fsync per new
+    message and artifact rather than one per chat, because an existing message file is never
+    rewritten and would otherwise stay truncated after a crash. Expect a durable sync of many
+    new messages to be noticeably slower, especially on network or spinning disks.
+
     Args:
         provider: The API provider instance.
         config: The configuration manager instance.
@@ -50,83 +78,262 @@ def sync_chats(provider, config, sync_all=False):
             "No active project set. Please select a project or use the -a flag to sync all chats."
         )
 
+    single_file = config.get("chat_messages_single_file", False)
+    durable = config.get("chat_sync_durable", False)
+    max_workers = max(1, config.get("chat_sync_workers", DEFAULT_CHAT_SYNC_WORKERS))
+
     # Fetch all chats for the organization
     logger.debug(f"Fetching chats for organization {organization_id}")
     chats = provider.get_chat_conversations(organization_id)
     logger.debug(f"Found {len(chats)} chats")
 
-    # Process each chat
-    for chat in tqdm(chats, desc="Chats"):
-        sync_chat(
-            active_project_id,
-            chat,
-            chat_destination,
-            organization_id,
-            provider,
-            sync_all,
-        )
+    # Only keep chats that belong to the active project, unless we're syncing all chats
+    if not sync_all:
+        chats = [
+            chat
+            for chat in chats
+            if (chat.get("project") or {}).get("uuid") == active_project_id
+        ]
+        logger.debug(f"{len(chats)} chats belong to the active project")
+
+    # Index the chats synced by earlier runs with a single directory scan
+    with os.scandir(chat_destination) as entries:
+        existing_chats = {
+            entry.name for entry in entries if entry.is_dir(follow_symlinks=False)
+        }
+
+    # Process chats concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                sync_chat,
+                chat,
+                chat_destination,
+                organization_id,
+                provider,
+                chat["uuid"] in existing_chats,
+                single_file,
+                durable,
+            )
+            for chat in chats
+        ]
+        try:
+            # Refresh at most twice a second, and stay quiet when not attached to a terminal
+            for future in tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc="Chats",
+                mininterval=0.5,
+                disable=None,
+            ):
+                future.result()
+        except BaseException:
+            # Don't fetch the remaining chats after a failure or Ctrl-C
+            for future in futures:
+                future.cancel()
+            raise
 
     logger.debug(f"Chats and artifacts synchronized to {chat_destination}")
 
 
 def sync_chat(
-    active_project_id, chat, chat_destination, organization_id, provider, sync_all
+    chat,
+    chat_destination,
+    organization_id,
+    provider,
+    existing=False,
+    single_file=False,
+    durable=False,
 ):
-    # Check if the chat belongs to the active project or if we're syncing all chats
-    if sync_all or (
-        chat.get("project") and chat["project"].get("uuid") == active_project_id
-    ):
-        logger.debug(f"Processing chat {chat['uuid']}")
-        chat_folder = os.path.join(chat_destination, chat["uuid"])
+    chat_uuid = chat["uuid"]
+    logger.debug(f"Processing chat {chat_uuid}")
+    chat_folder = os.path.join(chat_destination, chat_uuid)
+    metadata_file = os.path.join(chat_folder, "metadata.json")
+
+    if existing:
+        # Skip chats that haven't changed since they were last synced
+        if is_chat_up_to_date(metadata_file, chat):
+            logger.debug(f"Skipping unchanged chat {chat_uuid}")
+            return
+        with os.scandir(chat_folder) as entries:
+            existing_files = {entry.name for entry in entries}
+    else:
         os.makedirs(chat_folder, exist_ok=True)
+        existing_files = set()
 
-        # Save chat metadata
-        metadata_file = os.path.join(chat_folder, "metadata.json")
-        if not os.path.exists(metadata_file):
-            with open(metadata_file, "w") as f:
-                json.dump(chat, f, indent=2)
-
-        # Fetch full chat conversation
-        logger.debug(f"Fetching full conversation for chat {chat['uuid']}")
-        full_chat = provider.get_chat_conversation(organization_id, chat["uuid"])
-
-        # Process each message in the chat
-        for message in full_chat["chat_messages"]:
-            message_file = os.path.join(chat_folder, f"{message['uuid']}.json")
-
-            # Skip processing if the message file already exists
-            if os.path.exists(message_file):
-                logger.debug(f"Skipping existing message {message['uuid']}")
-                continue
-
-            # Save the message
-            with open(message_file, "w") as f:
-                json.dump(message, f, indent=2)
-
-            # Handle artifacts in assistant messages
-            if message["sender"] == "assistant":
-                artifacts = extract_artifacts(message["text"])
-                if artifacts:
-                    save_artifacts(artifacts, chat_folder, message)
-    else:
-        logger.debug(
-            f"Skipping chat {chat['uuid']} as it doesn't belong to the active project"
-        )
+    # Fetch full chat conversation
+    logger.debug(f"Fetching full conversation for chat {chat_uuid}")
+    full_chat = provider.get_chat_conversation(organization_id, chat_uuid)
+    messages = full_chat["chat_messages"]
+
+    # Process each message in the chat
+    artifacts = []
+    for message in messages:
+        message_uuid = message["uuid"]
+        if not single_file:
+            message_file_name = f"{message_uuid}.json"
+
+            # Skip saving the message if its file already exists
+            if message_file_name in existing_files:
+                logger.debug(f"Skipping existing message {message_uuid}")
+            else:
+                write_file(
+                    os.path.join(chat_folder, message_file_name),
+                    dump_json(message),
+                    durable,
+                )
+
+        # Collect artifacts in all assistant messages, including already saved ones,
+        # so artifacts missing after an interrupted sync are recovered
+        if message["sender"] == "assistant":
+            message_artifacts = extract_artifacts(message.get("text", ""))
+            if message_artifacts:
+                logger.info(
+                    f"Found {len(message_artifacts)} artifacts in message {message_uuid}"
+                )
+                artifacts.extend(message_artifacts)
+
+    # Save the artifacts of all messages in one pass
+    if artifacts:
+        save_artifacts(artifacts, chat_folder, durable)
+
+    if single_file:
+        save_messages(messages, chat_folder, durable)
+
+    # Persist the saved files before the metadata marks the chat as synced
+    if durable:
+        fsync_directory(chat_folder)
+
+    # Save chat metadata last, so an interrupted sync is resumed on the next run
+    write_file(metadata_file, dump_json(chat), durable)
+    if durable:
+        fsync_directory(chat_folder)
+
+
+def dump_json(obj, indent=True):
+    """
+    Serialize an object to UTF-8 encoded JSON, using orjson when it is installed.
+
+    Args:
+        obj: The object to serialize.
+        indent (bool): If True, pretty-print with an indent of 2. Otherwise emit compact JSON.
+
+    Returns:
+        bytes: The serialized JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def is_chat_up_to_date(metadata_file, chat):
+    """
+    Check whether a chat has already been synced at its current revision.
+
+    Args:
+        metadata_file (str): Path to the chat's saved metadata.json.
+        chat (dict): The chat summary returned by the provider.
+
+    Returns:
+        bool: True if the saved metadata has the same updated_at as the chat.
+    """
+    updated_at = chat.get("updated_at")
+    if updated_at is None:
+        return False
+    try:
+        # metadata.json is written as UTF-8 bytes, whatever the locale's encoding
+        with open(metadata_file, "rb") as f:
+            return json.load(f).get("updated_at") == updated_at
+    except (OSError, ValueError):
+        return False
+
+
+def write_file(path, data, durable=False):
+    """
+    Write bytes to a file, optionally flushing its contents to disk.
+
+    Args:
+        path (str): The file to write.
+        data (bytes): The content to write.
+        durable (bool): If True, fsync the file before returning.
+    """
+    with open(path, "wb") as f:
+        f.write(data)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def save_messages(messages, chat_folder, durable=False):
+    """
+    Save all messages of a chat to a single messages.jsonl file.
+
+    All messages are serialized into one payload and written to a temporary file
+    with a single write, which then atomically replaces the previous version.
+
+    Args:
+        messages (list): The chat messages to save.
+        chat_folder (str): The folder of the chat.
+        durable (bool): If True, flush the file to disk before replacing the previous version.
+    """
+    messages_file = os.path.join(chat_folder, "messages.jsonl")
+    temp_file = f"{messages_file}.tmp"
+    payload = b"".join(dump_json(message, indent=False) + b"\n" for message in messages)
+    write_file(temp_file, payload, durable)
+    os.replace(temp_file, messages_file)
 
 
-def save_artifacts(artifacts, chat_folder, message):
-    logger.info(f"Found {len(artifacts)} artifacts in message {message['uuid']}")
+def fsync_directory(path):
+    """
+    Flush the entries of a directory to disk.
+
+    This is a no-op on platforms that cannot open directories, such as Windows.
+
+    Args:
+        path (str): The directory to flush.
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def save_artifacts(artifacts, chat_folder, durable=False):
+    """
+    Save the artifacts of a chat to its artifacts folder.
+
+    Existing artifact files are kept. The folder is scanned once up front instead
+    of checking each artifact file individually.
+
+    Args:
+        artifacts (list): The artifacts extracted from the chat's messages.
+        chat_folder (str): The folder of the chat.
+        durable (bool): If True, flush the artifact files and the folder to disk.
+    """
     artifact_folder = os.path.join(chat_folder, "artifacts")
     os.makedirs(artifact_folder, exist_ok=True)
+    with os.scandir(artifact_folder) as entries:
+        existing_files = {entry.name for entry in entries}
+
     for artifact in artifacts:
         # Save each artifact
-        artifact_file = os.path.join(
-            artifact_folder,
-            f"{artifact['identifier']}.{get_file_extension(artifact['type'])}",
+        file_name = f"{artifact['identifier']}.{ARTIFACT_FILE_EXTENSIONS.get(artifact['type'], 'txt')}"
+        if file_name in existing_files:
+            continue
+        write_file(
+            os.path.join(artifact_folder, file_name),
+            artifact["content"].encode("utf-8"),
+            durable,
         )
-        if not os.path.exists(artifact_file):
-            with open(artifact_file, "w") as f:
-                f.write(artifact["content"])
+        existing_files.add(file_name)
+
+    if durable:
+        fsync_directory(artifact_folder)
 
 
 def get_file_extension(artifact_type):
@@ -139,14 +346,7 @@ def get_file_extension(artifact_type):
     Returns:
         str: The corresponding file extension.
     """
-    type_to_extension = {
-        "text/html": "html",
-        "application/vnd.ant.code": "txt",
-        "image/svg+xml": "svg",
-        "application/vnd.ant.mermaid": "mmd",
-        "application/vnd.ant.react": "jsx",
-    }
-    return type_to_extension.get(artifact_type, "txt")
+    return ARTIFACT_FILE_EXTENSIONS.get(artifact_type, "txt")
 
 
 def extract_artifacts(text):
@@ -155,6 +355,9 @@ def extract_artifacts(text):
 
     This function searches for antArtifact tags in the text and extracts
     the artifact information, including identifier, type, and content.
+    Only opening tags are matched by a regular expression; the closing tag is
+    located with a plain substring search, so the scan stays linear even when
+    a closing tag is missing.
 
     Args:
         text (str): The text to search for artifacts.
@@ -162,25 +365,24 @@ def extract_artifacts(text):
     Returns:
         list: A list of dictionaries containing artifact information.
     """
-    artifacts = []
+    # Most messages contain no artifacts, so avoid running the regex at all
+    if "<antArtifact" not in text:
+        return []
 
-    # Regular expression to match the <antArtifact> tags and extract their attributes and content
-    pattern = re.compile(
-        r'<antArtifact\s+identifier="([^"]+)"\s+type="([^"]+)"\s+title="([^"]+)">([\s\S]*?)</antArtifact>',
-        re.MULTILINE,
-    )
-
-    # Find all matches in the text
-    matches = pattern.findall(text)
-
-    for match in matches:
-        identifier, artifact_type, title, content = match
+    artifacts = []
+    match = ARTIFACT_START_PATTERN.search(text)
+    while match:
+        end = text.find(ARTIFACT_END_TAG, match.end())
+        if end == -1:
+            # Without a closing tag no later artifact can be complete either
+            break
         artifacts.append(
             {
-                "identifier": identifier,
-                "type": artifact_type,
-                "content": content.strip(),
+                "identifier": match.group("identifier"),
+                "type": match.group("type"),
+                "content": text[match.end() : end].strip(),
             }
         )
+        match = ARTIFACT_START_PATTERN.search(text, end + len(ARTIFACT_END_TAG))
 
     return artifacts
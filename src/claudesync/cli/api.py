@@ -1,7 +1,6 @@
 import click
 
 from claudesync.provider_factory import get_provider
-from ..utils import handle_errors
 from ..cli.organization import select as org_select
 from ..cli.project import select as proj_select
 
@@ -15,7 +14,6 @@ def api():
 @api.command()
 @click.argument("provider", required=False)
 @click.pass_context
-@handle_errors
 def login(ctx, provider):
     """Authenticate with an AI provider."""
     config = ctx.obj
@@ -61,9 +59,8 @@ def logout(config):
 @api.command()
 @click.option("--delay", type=float, required=True, help="Upload delay in seconds")
 @click.pass_obj
-@handle_errors
 def ratelimit(config, delay):
-    """Set the delay between file uploads during sync."""
+    """Set the delay between file uploads during sync, applied by each upload thread."""
     if delay < 0:
         click.echo("Error: Upload delay must be a non-negative number.")
         return
@@ -74,7 +71,6 @@ def ratelimit(config, delay):
 @api.command()
 @click.option("--size", type=int, required=True, help="Maximum file size in bytes")
 @click.pass_obj
-@handle_errors
 def max_filesize(config, size):
     """Set the maximum file size for syncing."""
     if size < 0:
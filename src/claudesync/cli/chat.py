@@ -1,8 +1,7 @@
 import click
 import logging
 from ..exceptions import ProviderError
-from ..utils import handle_errors, validate_and_get_provider
-from ..chat_sync import sync_chats
+from ..utils import validate_and_get_provider
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +14,16 @@ def chat():
 
 @chat.command()
 @click.pass_obj
-@handle_errors
 def sync(config):
     """Synchronize chats and their artifacts from the remote source."""
+    from ..chat_sync import sync_chats
+
     provider = validate_and_get_provider(config, require_project=True)
     sync_chats(provider, config)
 
 
 @chat.command()
 @click.pass_obj
-@handle_errors
 def ls(config):
     """List all chats."""
     provider = validate_and_get_provider(config)
@@ -45,7 +44,6 @@ def ls(config):
 @chat.command()
 @click.option("-a", "--all", "delete_all", is_flag=True, help="Delete all chats")
 @click.pass_obj
-@handle_errors
 def rm(config, delete_all):
     """Delete chats. Use -a to delete all chats, or select a chat to delete."""
     provider = validate_and_get_provider(config)
@@ -1,7 +1,6 @@
 import click
 
 from ..exceptions import ConfigurationError
-from ..utils import handle_errors
 
 
 @click.group()
@@ -14,7 +13,6 @@ def config():
 @click.argument("key")
 @click.argument("value")
 @click.pass_obj
-@handle_errors
 def set(config, key, value):
     """Set a configuration value."""
     # Check if the key exists in the configuration
@@ -43,7 +41,6 @@ def set(config, key, value):
 @config.command()
 @click.argument("key")
 @click.pass_obj
-@handle_errors
 def get(config, key):
     """Get a configuration value."""
     value = config.get(key)
@@ -55,7 +52,6 @@ def get(config, key):
 
 @config.command()
 @click.pass_obj
-@handle_errors
 def ls(config):
     """List all configuration values."""
     for key, value in config.config.items():
@@ -4,6 +4,7 @@ import click_completion.core
 
 from claudesync.cli.chat import chat
 from claudesync.config_manager import ConfigManager
+from claudesync.exceptions import ConfigurationError, ProviderError
 from .api import api
 from .organization import organization
 from .project import project
@@ -18,7 +19,22 @@ logging.basicConfig(
 click_completion.init()
 
 
-@click.group()
+class ErrorHandlingGroup(click.Group):
+    """
+    A click group that handles known errors for all of its commands.
+
+    ConfigurationError and ProviderError raised by any subcommand are caught once here
+    and printed as a friendly error message instead of a full traceback.
+    """
+
+    def invoke(self, ctx):
+        try:
+            return super().invoke(ctx)
+        except (ConfigurationError, ProviderError) as e:
+            click.echo(f"Error: {str(e)}")
+
+
+@click.group(cls=ErrorHandlingGroup)
 @click.pass_context
 def cli(ctx):
     """ClaudeSync: Synchronize local files with ai projects."""
@@ -1,6 +1,6 @@
 import click
 
-from ..utils import handle_errors, validate_and_get_provider
+from ..utils import validate_and_get_provider
 
 
 @click.group()
@@ -11,7 +11,6 @@ def organization():
 
 @organization.command()
 @click.pass_obj
-@handle_errors
 def ls(config):
     """List all available organizations with required capabilities."""
     provider = validate_and_get_provider(config, require_org=False)
@@ -28,7 +27,6 @@ def ls(config):
 
 @organization.command()
 @click.pass_context
-@handle_errors
 def select(ctx):
     """Set the active organization."""
     config = ctx.obj
@@ -3,9 +3,7 @@ import os
 import click
 
 from claudesync.exceptions import ProviderError
-from ..syncmanager import SyncManager
 from ..utils import (
-    handle_errors,
     validate_and_get_provider,
     validate_and_store_local_path,
     get_local_files,
@@ -20,7 +18,6 @@ def project():
 
 @project.command()
 @click.pass_obj
-@handle_errors
 def create(config):
     """Create a new project in the active organization."""
     provider = validate_and_get_provider(config)
@@ -38,8 +35,12 @@ def create(config):
             f"Project '{new_project['name']}' (uuid: {new_project['uuid']}) has been created successfully."
         )
 
-        config.set("active_project_id", new_project["uuid"])
-        config.set("active_project_name", new_project["name"])
+        config.update(
+            {
+                "active_project_id": new_project["uuid"],
+                "active_project_name": new_project["name"],
+            }
+        )
         click.echo(
             f"Active project set to: {new_project['name']} (uuid: {new_project['uuid']})"
         )
@@ -52,7 +53,6 @@ def create(config):
 
 @project.command()
 @click.pass_obj
-@handle_errors
 def archive(config):
     """Archive an existing project."""
     provider = validate_and_get_provider(config)
@@ -62,23 +62,20 @@ def archive(config):
         click.echo("No active projects found.")
         return
     click.echo("Available projects to archive:")
-    for idx, project in enumerate(projects, 1):
-        click.echo(f"  {idx}. {project['name']} (ID: {project['id']})")
-    selection = click.prompt("Enter the number of the project to archive", type=int)
-    if 1 <= selection <= len(projects):
-        selected_project = projects[selection - 1]
-        if click.confirm(
-            f"Are you sure you want to archive '{selected_project['name']}'?"
-        ):
-            provider.archive_project(active_organization_id, selected_project["id"])
-            click.echo(f"Project '{selected_project['name']}' has been archived.")
-    else:
-        click.echo("Invalid selection. Please try again.")
+    display_project_list(projects)
+    # IntRange re-prompts on invalid input, reusing the fetched project list
+    selection = click.prompt(
+        "Enter the number of the project to archive",
+        type=click.IntRange(1, len(projects)),
+    )
+    selected_project = projects[selection - 1]
+    if click.confirm(f"Are you sure you want to archive '{selected_project['name']}'?"):
+        provider.archive_project(active_organization_id, selected_project["id"])
+        click.echo(f"Project '{selected_project['name']}' has been archived.")
 
 
 @project.command()
 @click.pass_context
-@handle_errors
 def select(ctx):
     """Set the active project for syncing."""
     config = ctx.obj
@@ -89,20 +86,33 @@ def select(ctx):
         click.echo("No active projects found.")
         return
     click.echo("Available projects:")
-    for idx, project in enumerate(projects, 1):
-        click.echo(f"  {idx}. {project['name']} (ID: {project['id']})")
-    selection = click.prompt("Enter the number of the project to select", type=int)
-    if 1 <= selection <= len(projects):
-        selected_project = projects[selection - 1]
-        config.set("active_project_id", selected_project["id"])
-        config.set("active_project_name", selected_project["name"])
-        click.echo(
-            f"Selected project: {selected_project['name']} (ID: {selected_project['id']})"
-        )
+    display_project_list(projects)
+    selection = click.prompt(
+        "Enter the number of the project to select",
+        type=click.IntRange(1, len(projects)),
+    )
+    selected_project = projects[selection - 1]
+    config.update(
+        {
+            "active_project_id": selected_project["id"],
+            "active_project_name": selected_project["name"],
+        }
+    )
+    click.echo(
+        f"Selected project: {selected_project['name']} (ID: {selected_project['id']})"
+    )
 
-        validate_and_store_local_path(config)
-    else:
-        click.echo("Invalid selection. Please try again.")
+    validate_and_store_local_path(config)
+
+
+def display_project_list(projects):
+    """Display a numbered list of projects to the user in a single write."""
+    click.echo(
+        "\n".join(
+            f"  {idx}. {project['name']} (ID: {project['id']})"
+            for idx, project in enumerate(projects, 1)
+        )
+    )
 
 
 @project.command()
@@ -114,7 +124,6 @@ def select(ctx):
     help="Include archived projects in the list",
 )
 @click.pass_obj
-@handle_errors
 def ls(config, show_all):
     """List all projects in the active organization."""
     provider = validate_and_get_provider(config)
@@ -131,9 +140,10 @@ def ls(config, show_all):
 
 @project.command()
 @click.pass_obj
-@handle_errors
 def sync(config):
     """Synchronize only the project files."""
+    from ..syncmanager import SyncManager
+
     provider = validate_and_get_provider(config, require_project=True)
 
     sync_manager = SyncManager(provider, config)
@@ -5,14 +5,11 @@ import click
 from crontab import CronTab
 
 from claudesync.utils import get_local_files
-from ..utils import handle_errors, validate_and_get_provider
-from ..syncmanager import SyncManager
-from ..chat_sync import sync_chats
+from ..utils import validate_and_get_provider
 
 
 @click.command()
 @click.pass_obj
-@handle_errors
 def ls(config):
     """List files in the active remote project."""
     provider = validate_and_get_provider(config, require_project=True)
@@ -33,9 +30,11 @@ def ls(config):
 
 @click.command()
 @click.pass_obj
-@handle_errors
 def sync(config):
     """Synchronize both projects and chats."""
+    from ..syncmanager import SyncManager
+    from ..chat_sync import sync_chats
+
     provider = validate_and_get_provider(config, require_project=True)
 
     # Sync projects
@@ -68,7 +67,6 @@ def validate_local_path(local_path):
 @click.option(
     "--interval", type=int, default=5, prompt="Enter sync interval in minutes"
 )
-@handle_errors
 def schedule(config, interval):
     """Set up automated synchronization at regular intervals."""
     claudesync_path = shutil.which("claudesync")
@@ -2,6 +2,9 @@ import datetime
 import json
 from pathlib import Path
 
+# Chat syncing is dominated by HTTP round-trips, so fetch several chats at once
+DEFAULT_CHAT_SYNC_WORKERS = 8
+
 
 class ConfigManager:
     """
@@ -39,9 +42,13 @@ class ConfigManager:
         return {
             "log_level": "INFO",
             "upload_delay": 0.5,
+            "upload_parallelism": 1,  # Each upload thread waits upload_delay on its own
             "max_file_size": 32 * 1024,  # Default 32 KB
             "two_way_sync": False,  # Default to False
             "curl_use_file_input": False,
+            "chat_messages_single_file": False,
+            "chat_sync_durable": False,  # fsync every chat file, see sync_chats
+            "chat_sync_workers": DEFAULT_CHAT_SYNC_WORKERS,
         }
 
     def _load_config(self):
@@ -105,10 +112,22 @@ class ConfigManager:
 
         This method updates the configuration with the provided key-value pair and then saves the configuration to the file.
         """
-        if key == "chat_destination":
-            # Expand user home directory for path-based settings
-            value = str(Path(value).expanduser())
-        self.config[key] = value
+        self.update({key: value})
+
+    def update(self, values):
+        """
+        Sets several configuration values and saves the configuration once.
+
+        For path-based settings (chat_destination), this method expands the user's home directory.
+
+        Args:
+            values (dict): The configuration settings to set, keyed by name.
+        """
+        for key, value in values.items():
+            if key == "chat_destination":
+                # Expand user home directory for path-based settings
+                value = str(Path(value).expanduser())
+            self.config[key] = value
         self._save_config()
 
     def set_session_key(self, session_key, expiry: datetime):
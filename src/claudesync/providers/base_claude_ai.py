@@ -1,5 +1,6 @@
 import datetime
 import logging
+import time
 import urllib
 
 import click
@@ -36,11 +37,13 @@ def _get_session_key_expiry():
 
 class BaseClaudeAIProvider(BaseProvider):
     BASE_URL = "https://api.claude.ai/api"
+    PROJECTS_CACHE_TTL = 60  # seconds
 
     def __init__(self, session_key=None, session_key_expiry=None):
         self.config = ConfigManager()
         self.session_key = session_key
         self.session_key_expiry = session_key_expiry
+        self._projects_cache = {}
         self.logger = logging.getLogger(__name__)
         self._configure_logging()
 
@@ -114,17 +117,27 @@ class BaseClaudeAIProvider(BaseProvider):
         ]
 
     def get_projects(self, organization_id, include_archived=False):
-        response = self._make_request(
-            "GET", f"/organizations/{organization_id}/projects"
-        )
+        cached = self._projects_cache.get(organization_id)
+        if cached and time.monotonic() - cached[0] < self.PROJECTS_CACHE_TTL:
+            all_projects = cached[1]
+        else:
+            response = self._make_request(
+                "GET", f"/organizations/{organization_id}/projects"
+            )
+            all_projects = [
+                {
+                    "id": project["uuid"],
+                    "name": project["name"],
+                    "archived_at": project.get("archived_at"),
+                }
+                for project in response
+            ]
+            self._projects_cache[organization_id] = (time.monotonic(), all_projects)
+
         projects = [
-            {
-                "id": project["uuid"],
-                "name": project["name"],
-                "archived_at": project.get("archived_at"),
-            }
-            for project in response
-            if include_archived or project.get("archived_at") is None
+            project
+            for project in all_projects
+            if include_archived or project["archived_at"] is None
         ]
         return projects
 
@@ -155,12 +168,14 @@ class BaseClaudeAIProvider(BaseProvider):
         )
 
     def archive_project(self, organization_id, project_id):
+        self._projects_cache.pop(organization_id, None)
         data = {"is_archived": True}
         return self._make_request(
             "PUT", f"/organizations/{organization_id}/projects/{project_id}", data
         )
 
     def create_project(self, organization_id, name, description=""):
+        self._projects_cache.pop(organization_id, None)
         data = {"name": name, "description": description, "is_private": True}
         return self._make_request(
             "POST", f"/organizations/{organization_id}/projects", data
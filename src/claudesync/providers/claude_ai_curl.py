@@ -6,6 +6,11 @@ from .base_claude_ai import BaseClaudeAIProvider
 from ..exceptions import ProviderError
 from ..config_manager import ConfigManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ClaudeAICurlProvider(BaseClaudeAIProvider):
     def __init__(self, session_key=None, session_key_expiry=None):
@@ -90,6 +95,9 @@ class ClaudeAICurlProvider(BaseClaudeAIProvider):
                 return None
 
             try:
+                # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+                if orjson is not None:
+                    return orjson.loads(response_body)
                 return json.loads(response_body)
             except json.JSONDecodeError as e:
                 error_message = (
@@ -1,6 +1,7 @@
 import os
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 
 from tqdm import tqdm
@@ -21,7 +22,10 @@ class SyncManager:
                            - active_organization_id (str): ID of the active organization.
                            - active_project_id (str): ID of the active project.
                            - local_path (str): Path to the local directory to be synchronized.
-                           - upload_delay (float, optional): Delay between upload operations in seconds. Defaults to 0.5.
+                           - upload_delay (float, optional): Delay after each upload operation in seconds, applied
+                             by every upload thread. Defaults to 0.5.
+                           - upload_parallelism (int, optional): Number of files uploaded concurrently. The request
+                             rate grows with it, since each thread waits upload_delay on its own. Defaults to 1.
                            - two_way_sync (bool, optional): Flag to enable two-way synchronization. Defaults to False.
         """
         self.provider = provider
@@ -30,6 +34,7 @@ class SyncManager:
         self.active_project_id = config.get("active_project_id")
         self.local_path = config.get("local_path")
         self.upload_delay = config.get("upload_delay", 0.5)
+        self.upload_parallelism = max(1, config.get("upload_parallelism", 1))
         self.two_way_sync = config.get("two_way_sync", False)
 
     def sync(self, local_files, remote_files):
@@ -38,7 +43,9 @@ class SyncManager:
 
         This method manages the synchronization between local and remote files. It handles the
         synchronization from local to remote, updates local timestamps, performs two-way sync if enabled,
-        and deletes remote files that are no longer present locally.
+        and deletes remote files that are no longer present locally. Local files are uploaded by up to
+        `upload_parallelism` threads at a time. Each thread waits `upload_delay` after each of its own
+        operations, so up to `upload_parallelism` requests are made per `upload_delay`.
 
         Args:
             local_files (dict): Dictionary of local file names and their corresponding checksums.
@@ -48,38 +55,80 @@ class SyncManager:
                                  - "created_at" (str): Timestamp when the file was created in ISO format.
                                  - "uuid" (str): Unique identifier of the remote file.
         """
-        remote_files_to_delete = set(rf["file_name"] for rf in remote_files)
+        # Index remote files by name, keeping the first file for duplicate names
+        remote_files_by_name = {rf["file_name"]: rf for rf in reversed(remote_files)}
+        remote_files_to_delete = set(remote_files_by_name)
         synced_files = set()
 
-        with tqdm(total=len(local_files), desc="Local → Remote") as pbar:
-            for local_file, local_checksum in local_files.items():
-                remote_file = next(
-                    (rf for rf in remote_files if rf["file_name"] == local_file), None
+        with ThreadPoolExecutor(max_workers=self.upload_parallelism) as executor:
+            futures = [
+                executor.submit(
+                    self.sync_local_file,
+                    local_file,
+                    local_checksum,
+                    remote_files_by_name.get(local_file),
+                    remote_files_to_delete,
+                    synced_files,
                 )
-                if remote_file:
-                    self.update_existing_file(
-                        local_file,
-                        local_checksum,
-                        remote_file,
-                        remote_files_to_delete,
-                        synced_files,
-                    )
-                else:
-                    self.upload_new_file(local_file, synced_files)
-                pbar.update(1)
+                for local_file, local_checksum in local_files.items()
+            ]
+            try:
+                # Refresh the overall progress at most twice a second
+                for future in tqdm(
+                    as_completed(futures),
+                    total=len(futures),
+                    desc="Local → Remote",
+                    mininterval=0.5,
+                ):
+                    future.result()
+            except BaseException:
+                # Don't start queued uploads after a failure or Ctrl-C
+                for future in futures:
+                    future.cancel()
+                raise
 
         self.update_local_timestamps(remote_files, synced_files)
 
         if self.two_way_sync:
-            with tqdm(total=len(remote_files), desc="Local ← Remote") as pbar:
+            with tqdm(
+                total=len(remote_files), desc="Local ← Remote", mininterval=0.5
+            ) as pbar:
                 for remote_file in remote_files:
                     self.sync_remote_to_local(
                         remote_file, remote_files_to_delete, synced_files
                     )
                     pbar.update(1)
         for file_to_delete in list(remote_files_to_delete):
-            self.delete_remote_files(file_to_delete, remote_files)
-            pbar.update(1)
+            self.delete_remote_files(remote_files_by_name[file_to_delete])
+
+    def sync_local_file(
+        self,
+        local_file,
+        local_checksum,
+        remote_file,
+        remote_files_to_delete,
+        synced_files,
+    ):
+        """
+        Synchronize a single local file to the remote project.
+
+        Args:
+            local_file (str): Name of the local file.
+            local_checksum (str): MD5 checksum of the local file content.
+            remote_file (dict or None): Dictionary representing the remote file with the same name, if any.
+            remote_files_to_delete (set): Set of remote file names to be considered for deletion.
+            synced_files (set): Set of file names that have been synchronized.
+        """
+        if remote_file:
+            self.update_existing_file(
+                local_file,
+                local_checksum,
+                remote_file,
+                remote_files_to_delete,
+                synced_files,
+            )
+        else:
+            self.upload_new_file(local_file, synced_files)
 
     def update_existing_file(
         self,
@@ -253,20 +302,17 @@ class SyncManager:
         if remote_file["file_name"] in remote_files_to_delete:
             remote_files_to_delete.remove(remote_file["file_name"])
 
-    def delete_remote_files(self, file_to_delete, remote_files):
+    def delete_remote_files(self, remote_file):
         """
         Delete a file from the remote project that no longer exists locally.
 
         This method deletes a remote file that is not present in the local directory.
 
         Args:
-            file_to_delete (str): Name of the remote file to be deleted.
-            remote_files (list): List of dictionaries representing remote files.
+            remote_file (dict): Dictionary representing the remote file to be deleted.
         """
+        file_to_delete = remote_file["file_name"]
         logger.debug(f"Deleting {file_to_delete} from remote...")
-        remote_file = next(
-            rf for rf in remote_files if rf["file_name"] == file_to_delete
-        )
         with tqdm(total=1, desc=f"Deleting {file_to_delete}", leave=False) as pbar:
             self.provider.delete_file(
                 self.active_organization_id, self.active_project_id, remote_file["uuid"]
@@ -1,6 +1,7 @@
 import os
 import hashlib
-from functools import wraps
+import json
+import time
 import click
 import pathspec
 import logging
@@ -11,6 +12,17 @@ from claudesync.config_manager import ConfigManager
 logger = logging.getLogger(__name__)
 config_manager = ConfigManager()
 
+# Cached (size, mtime) and hash of each local file, one manifest per project. Manifests of
+# projects that are moved or deleted are never pruned; they are small and safe to delete by hand.
+MANIFEST_DIR = config_manager.config_dir / "manifests"
+
+# Coarsest common file modification time resolution (FAT). A file modified this close to
+# the time it was hashed could change again without changing its size or mtime.
+MTIME_GRANULARITY_NS = 2 * 10**9
+
+# Provider instances by (provider name, session key, session key expiry)
+_providers = {}
+
 
 def normalize_and_calculate_md5(content):
     """
@@ -94,7 +106,15 @@ def compute_md5_hash(content):
     return hashlib.md5(content.encode("utf-8")).hexdigest()
 
 
-def should_process_file(file_path, filename, gitignore, base_path, claudeignore):
+def should_process_file(
+    file_path,
+    filename,
+    gitignore,
+    base_path,
+    claudeignore,
+    file_size=None,
+    check_text=True,
+):
     """
     Determines whether a file should be processed based on various criteria.
 
@@ -111,13 +131,17 @@ def should_process_file(file_path, filename, gitignore, base_path, claudeignore)
         gitignore (pathspec.PathSpec or None): A PathSpec object containing .gitignore patterns, if available.
         base_path (str): The base directory path of the project.
         claudeignore (pathspec.PathSpec or None): A PathSpec object containing .claudeignore patterns, if available.
+        file_size (int, optional): The size of the file, if already known. Otherwise the file is stat'ed.
+        check_text (bool, optional): Whether to open the file to check that it is a text file. Defaults to True.
 
     Returns:
         bool: True if the file should be processed, False otherwise.
     """
     # Check file size
     max_file_size = config_manager.get("max_file_size", 32 * 1024)
-    if os.path.getsize(file_path) > max_file_size:
+    if file_size is None:
+        file_size = os.path.getsize(file_path)
+    if file_size > max_file_size:
         return False
 
     # Skip temporary editor files
@@ -135,7 +159,7 @@ def should_process_file(file_path, filename, gitignore, base_path, claudeignore)
         return False
 
     # Check if it's a text file
-    return is_text_file(file_path)
+    return not check_text or is_text_file(file_path)
 
 
 def process_file(file_path):
@@ -167,7 +191,8 @@ def get_local_files(local_path):
     """
     Retrieves a dictionary of local files within a specified path, applying various filters.
 
-    This function walks through the directory specified by `local_path`, applying several filters to each file:
+    This function walks through the directory specified by `local_path` with `os.scandir`, applying several filters
+    to each file:
     - Excludes files in directories like .git, .svn, etc.
     - Skips files larger than a specified maximum size (default 200KB, configurable).
     - Ignores temporary editor files (ending with '~').
@@ -176,6 +201,9 @@ def get_local_files(local_path):
     - Checks if the file is a text file before processing.
     Each file that passes these filters is read, and its content is hashed using MD5. The function returns a dictionary
     where each key is the relative path of a file from `local_path`, and its value is the MD5 hash of the file's content.
+    Hashes are cached in a manifest in the configuration directory, so files whose size and modification time are
+    unchanged since the previous call are not opened again. Each file is stat'ed once, and that result is shared by the
+    size filter and the manifest lookup.
 
     Args:
         local_path (str): The base directory path to search for files.
@@ -185,70 +213,147 @@ def get_local_files(local_path):
     """
     gitignore = load_gitignore(local_path)
     claudeignore = load_claudeignore(local_path)
+    scanned_at_ns = time.time_ns()
+    manifest = load_manifest(local_path)
+    new_manifest = {}
     files = {}
     exclude_dirs = {".git", ".svn", ".hg", ".bzr", "_darcs", "CVS", "claude_chats"}
 
-    for root, dirs, filenames in os.walk(local_path, topdown=True):
-        rel_root = os.path.relpath(root, local_path)
-        rel_root = "" if rel_root == "." else rel_root
-
-        # Filter out directories before traversing
-        dirs[:] = [
-            d
-            for d in dirs
-            if d not in exclude_dirs
-            and not (gitignore and gitignore.match_file(os.path.join(rel_root, d)))
-            and not (
-                claudeignore and claudeignore.match_file(os.path.join(rel_root, d))
-            )
-        ]
-
-        for filename in filenames:
-            rel_path = os.path.join(rel_root, filename)
-            full_path = os.path.join(root, filename)
-
+    # Directories still to be scanned, as (full path, path relative to local_path)
+    pending_dirs = [(local_path, "")]
+    while pending_dirs:
+        root, rel_root = pending_dirs.pop()
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug(f"Unable to scan directory {root}: {str(e)}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            rel_path = os.path.join(rel_root, entry.name)
+
+            if entry.is_dir():
+                # Filter out directories before traversing, without following symlinks
+                if (
+                    not entry.is_symlink()
+                    and entry.name not in exclude_dirs
+                    and not (gitignore and gitignore.match_file(rel_path))
+                    and not (claudeignore and claudeignore.match_file(rel_path))
+                ):
+                    subdirs.append((entry.path, rel_path))
+                continue
+
+            if not entry.is_file():
+                continue
+
+            stat = entry.stat()
+            # A file with an up-to-date manifest entry was already found to be text, so it is not opened
+            cached = manifest.get(rel_path)
+            is_cached = bool(cached) and cached[:2] == [stat.st_size, stat.st_mtime_ns]
             if should_process_file(
-                full_path, filename, gitignore, local_path, claudeignore
+                entry.path,
+                entry.name,
+                gitignore,
+                local_path,
+                claudeignore,
+                file_size=stat.st_size,
+                check_text=not is_cached,
             ):
-                file_hash = process_file(full_path)
+                file_hash = cached[2] if is_cached else process_file(entry.path)
                 if file_hash:
                     files[rel_path] = file_hash
+                    new_manifest[rel_path] = [stat.st_size, stat.st_mtime_ns, file_hash]
+
+        # Visit subdirectories depth-first in listing order, like os.walk
+        pending_dirs.extend(reversed(subdirs))
+
+    if new_manifest != manifest:
+        save_manifest(local_path, new_manifest, scanned_at_ns)
 
     return files
 
 
-def handle_errors(func):
+def get_manifest_path(base_path):
     """
-    A decorator that wraps a function to catch and handle specific exceptions.
+    Returns the path of the manifest of cached file hashes for a project.
 
-    This decorator catches exceptions of type ConfigurationError and ProviderError
-    that are raised within the decorated function. When such an exception is caught,
-    it prints an error message to the console using click's echo function. This is
-    useful for CLI applications where a friendly error message is preferred over a
-    full traceback for known error conditions.
+    Manifests are kept in the configuration directory, keyed by a hash of the project's absolute path,
+    so nothing is written into the synchronized directory itself. A project that is moved gets a new
+    manifest, and stale manifests are never pruned.
 
     Args:
-        func (Callable): The function to be decorated.
+        base_path (str): The base directory path of the project.
 
     Returns:
-        Callable: The wrapper function that includes exception handling.
+        str: The path of the project's manifest file.
     """
+    key = hashlib.md5(os.path.abspath(base_path).encode("utf-8")).hexdigest()
+    return os.path.join(MANIFEST_DIR, f"{key}.json")
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except (ConfigurationError, ProviderError) as e:
-            click.echo(f"Error: {str(e)}")
 
-    return wrapper
+def load_manifest(base_path):
+    """
+    Loads the manifest of cached file hashes for the specified base path.
+
+    Entries for files modified within MTIME_GRANULARITY_NS of the previous scan are left out, since such a file
+    may have been changed again after it was hashed without its size or modification time changing.
+
+    Args:
+        base_path (str): The base directory path of the project.
+
+    Returns:
+        dict: A dictionary mapping relative file paths to `[size, mtime_ns, md5]` lists,
+              or an empty dictionary if no readable manifest exists.
+    """
+    try:
+        with open(get_manifest_path(base_path), "r") as f:
+            manifest = json.load(f)
+        trusted_before_ns = manifest["scanned_at_ns"] - MTIME_GRANULARITY_NS
+        return {
+            rel_path: entry
+            for rel_path, entry in manifest["files"].items()
+            if entry[1] < trusted_before_ns
+        }
+    except (OSError, ValueError, KeyError, TypeError, IndexError):
+        return {}
+
+
+def save_manifest(base_path, manifest, scanned_at_ns):
+    """
+    Saves the manifest of cached file hashes for the specified base path.
+
+    The manifest is written to a temporary file that then replaces the previous one, so an interrupted
+    or concurrent save never leaves a truncated manifest behind. Failing to save the manifest is not an
+    error; the hashes are simply recomputed next time.
+
+    Args:
+        base_path (str): The base directory path of the project.
+        manifest (dict): A dictionary mapping relative file paths to `[size, mtime_ns, md5]` lists.
+        scanned_at_ns (int): The time, in nanoseconds since the epoch, at which the files were scanned.
+    """
+    manifest_path = get_manifest_path(base_path)
+    temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with open(temp_path, "w") as f:
+            json.dump({"scanned_at_ns": scanned_at_ns, "files": manifest}, f)
+        os.replace(temp_path, manifest_path)
+    except OSError as e:
+        logger.debug(f"Unable to save file manifest {manifest_path}: {str(e)}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
 
 
 def validate_and_get_provider(config, require_org=True, require_project=False):
     """
     Validates the configuration for the presence of an active provider and session key,
     and optionally checks for an active organization ID and project ID. If validation passes,
-    it retrieves the provider instance based on the active provider name.
+    it retrieves the provider instance based on the active provider name. The instance is reused by later
+    calls with the same provider and session key, so its caches are shared within the process.
 
     Args:
         config (ConfigManager): The configuration manager instance containing settings.
@@ -285,7 +390,10 @@ def validate_and_get_provider(config, require_org=True, require_project=False):
             "No active project set. Please select or create a project."
         )
     session_key_expiry = config.get("session_key_expiry")
-    return get_provider(active_provider, session_key, session_key_expiry)
+    key = (active_provider, session_key, session_key_expiry)
+    if key not in _providers:
+        _providers[key] = get_provider(active_provider, session_key, session_key_expiry)
+    return _providers[key]
 
 
 def validate_and_store_local_path(config):
@@ -293,7 +401,7 @@ def validate_and_store_local_path(config):
     Prompts the user for the absolute path to their local project directory and stores it in the configuration.
 
     This function repeatedly prompts the user to enter the absolute path to their local project directory until
-    a valid absolute path is provided. The path is validated to ensure it exists, is a directory, and is an absolute path.
+    a valid path is provided. The path is validated to ensure it exists and is a directory, and is resolved to an absolute path.
     Once a valid path is provided, it is stored in the configuration using the `set` method of the `ConfigManager` object.
 
     Args:
@@ -302,28 +410,17 @@ def validate_and_store_local_path(config):
     Note:
         This function uses `click.prompt` to interact with the user, providing a default path (the current working directory)
         and validating the user's input to ensure it meets the criteria for an absolute path to a directory.
+        `click.Path` checks the directory with a single stat and resolves it to an absolute path, so the
+        result is stored as is.
     """
-
-    def get_default_path():
-        return os.getcwd()
-
-    while True:
-        default_path = get_default_path()
-        local_path = click.prompt(
-            "Enter the absolute path to your local project directory",
-            type=click.Path(
-                exists=True, file_okay=False, dir_okay=True, resolve_path=True
-            ),
-            default=default_path,
-            show_default=True,
-        )
-
-        if os.path.isabs(local_path):
-            config.set("local_path", local_path)
-            click.echo(f"Local path set to: {local_path}")
-            break
-        else:
-            click.echo("Please enter an absolute path.")
+    local_path = click.prompt(
+        "Enter the absolute path to your local project directory",
+        type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True),
+        default=os.getcwd(),
+        show_default=True,
+    )
+    config.set("local_path", local_path)
+    click.echo(f"Local path set to: {local_path}")
 
 
 def load_claudeignore(base_path):
@@ -9,7 +9,7 @@ class TestChatCLI(unittest.TestCase):
         self.runner = CliRunner()
 
     @patch("claudesync.cli.chat.validate_and_get_provider")
-    @patch("claudesync.cli.chat.sync_chats")
+    @patch("claudesync.chat_sync.sync_chats")
     def test_sync_command(self, mock_sync_chats, mock_validate_and_get_provider):
         mock_provider = MagicMock()
         mock_validate_and_get_provider.return_value = mock_provider
@@ -124,7 +124,7 @@ class TestProjectCLI(unittest.TestCase):
         )
 
     @patch("claudesync.cli.project.validate_and_get_provider")
-    @patch("claudesync.cli.project.SyncManager")
+    @patch("claudesync.syncmanager.SyncManager")
     @patch("claudesync.cli.project.get_local_files")
     def test_project_sync(
         self, mock_get_local_files, mock_sync_manager, mock_validate_and_get_provider
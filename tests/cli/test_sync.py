@@ -28,9 +28,9 @@ class TestSyncCLI(unittest.TestCase):
         )
 
     @patch("claudesync.cli.sync.validate_and_get_provider")
-    @patch("claudesync.cli.sync.SyncManager")
+    @patch("claudesync.syncmanager.SyncManager")
     @patch("claudesync.cli.sync.get_local_files")
-    @patch("claudesync.cli.sync.sync_chats")
+    @patch("claudesync.chat_sync.sync_chats")
     def test_sync_command(
         self,
         mock_sync_chats,
@@ -88,6 +88,23 @@ class TestBaseClaudeAIProvider(unittest.TestCase):
         self.assertEqual(result[0]["id"], "proj1")
         self.assertEqual(result[1]["id"], "proj3")
 
+    @patch("claudesync.providers.base_claude_ai.BaseClaudeAIProvider._make_request")
+    def test_get_projects_cached(self, mock_make_request):
+        mock_make_request.return_value = [
+            {"uuid": "proj1", "name": "Project 1", "archived_at": None},
+            {"uuid": "proj2", "name": "Project 2", "archived_at": "2023-01-01"},
+        ]
+
+        self.assertEqual(len(self.provider.get_projects("org1")), 1)
+        self.assertEqual(
+            len(self.provider.get_projects("org1", include_archived=True)), 2
+        )
+        self.assertEqual(mock_make_request.call_count, 1)
+
+        self.provider.archive_project("org1", "proj1")
+        self.provider.get_projects("org1")
+        self.assertEqual(mock_make_request.call_count, 3)
+
     def test_make_request_not_implemented(self):
         with self.assertRaises(NotImplementedError):
             self.provider._make_request("GET", "/test")
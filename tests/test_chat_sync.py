@@ -1,9 +1,19 @@
+import json
+import os
+import tempfile
 import textwrap
+import threading
 import unittest
-from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
-from claudesync.chat_sync import extract_artifacts, get_file_extension, sync_chats
-from claudesync.exceptions import ConfigurationError
+from claudesync.chat_sync import (
+    extract_artifacts,
+    get_file_extension,
+    sync_chats,
+    write_file,
+)
+from claudesync.exceptions import ConfigurationError, ProviderError
 
 
 class TestExtractArtifacts(unittest.TestCase):
@@ -11,11 +21,25 @@ class TestExtractArtifacts(unittest.TestCase):
     def setUp(self):
         self.mock_provider = MagicMock()
         self.mock_config = MagicMock()
-        self.mock_config.get.side_effect = lambda key, default=None: {
-            "local_path": "/test/path",
+        self.set_config()
+
+    def set_config(self, local_path="/test/path", **settings):
+        config = {
+            "local_path": local_path,
             "active_organization_id": "org123",
             "active_project_id": "proj456",
-        }.get(key, default)
+            **settings,
+        }
+        self.mock_config.get.side_effect = lambda key, default=None: config.get(
+            key, default
+        )
+
+    def make_local_path(self, **settings):
+        """Create a temporary local path, removed after the test, and configure it."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.set_config(tmpdir.name, **settings)
+        return tmpdir.name
 
     def test_extract_single_artifact(self):
         text = """
@@ -76,6 +100,19 @@ class TestExtractArtifacts(unittest.TestCase):
         expected_result = []
         self.assertEqual(extract_artifacts(text), expected_result)
 
+    def test_unterminated_artifact(self):
+        text = """
+        <antArtifact identifier="done" type="text/plain" title="Done">
+        Complete.
+        </antArtifact>
+        <antArtifact identifier="open" type="text/plain" title="Open">
+        Never closed.
+        """
+        expected_result = [
+            {"identifier": "done", "type": "text/plain", "content": "Complete."}
+        ]
+        self.assertEqual(extract_artifacts(textwrap.dedent(text)), expected_result)
+
     def test_sync_chats_no_local_path(self):
         self.mock_config.get.side_effect = lambda key, default=None: (
             None if key == "local_path" else "some_value"
@@ -90,6 +127,188 @@ class TestExtractArtifacts(unittest.TestCase):
         with self.assertRaises(ConfigurationError):
             sync_chats(self.mock_provider, self.mock_config)
 
+    def test_sync_chats_saves_messages_and_artifacts(self):
+        tmpdir = self.make_local_path()
+        self.mock_provider.get_chat_conversations.return_value = [
+            {"uuid": "chat1", "project": {"uuid": "proj456"}},
+            {"uuid": "chat2", "project": {"uuid": "other"}},
+        ]
+        self.mock_provider.get_chat_conversation.return_value = {
+            "chat_messages": [
+                {"uuid": "msg1", "sender": "human", "text": "Hello"},
+                {
+                    "uuid": "msg2",
+                    "sender": "assistant",
+                    "text": '<antArtifact identifier="page" type="text/html" '
+                    'title="Page"><p>Hi</p></antArtifact>',
+                },
+            ]
+        }
+
+        sync_chats(self.mock_provider, self.mock_config)
+
+        chat_folder = os.path.join(tmpdir, "claude_chats", "chat1")
+        with open(os.path.join(chat_folder, "msg1.json")) as f:
+            self.assertEqual(json.load(f)["text"], "Hello")
+        with open(os.path.join(chat_folder, "artifacts", "page.html")) as f:
+            self.assertEqual(f.read(), "<p>Hi</p>")
+        self.assertFalse(os.path.exists(os.path.join(tmpdir, "claude_chats", "chat2")))
+        self.mock_provider.get_chat_conversation.assert_called_once_with(
+            "org123", "chat1"
+        )
+
+    def test_sync_chats_skips_unchanged_chats(self):
+        self.make_local_path()
+        self.mock_provider.get_chat_conversations.return_value = [
+            {
+                "uuid": "chat1",
+                "name": "Café 東京",
+                "project": {"uuid": "proj456"},
+                "updated_at": "2024-01-01T00:00:00Z",
+            }
+        ]
+        self.mock_provider.get_chat_conversation.return_value = {
+            "chat_messages": [{"uuid": "msg1", "sender": "human", "text": "Hi"}]
+        }
+
+        sync_chats(self.mock_provider, self.mock_config)
+        sync_chats(self.mock_provider, self.mock_config)
+
+        self.mock_provider.get_chat_conversation.assert_called_once_with(
+            "org123", "chat1"
+        )
+
+    def test_sync_chats_keeps_existing_messages(self):
+        tmpdir = self.make_local_path()
+        chat_folder = os.path.join(tmpdir, "claude_chats", "chat1")
+        os.makedirs(chat_folder)
+        with open(os.path.join(chat_folder, "msg1.json"), "w") as f:
+            f.write("existing")
+        self.mock_provider.get_chat_conversations.return_value = [
+            {"uuid": "chat1", "project": {"uuid": "proj456"}}
+        ]
+        self.mock_provider.get_chat_conversation.return_value = {
+            "chat_messages": [
+                {"uuid": "msg1", "sender": "human", "text": "Hello"},
+                {"uuid": "msg2", "sender": "human", "text": "Again"},
+            ]
+        }
+
+        sync_chats(self.mock_provider, self.mock_config)
+
+        with open(os.path.join(chat_folder, "msg1.json")) as f:
+            self.assertEqual(f.read(), "existing")
+        with open(os.path.join(chat_folder, "msg2.json")) as f:
+            self.assertEqual(json.load(f)["text"], "Again")
+
+    def test_sync_chats_recovers_artifacts_after_interruption(self):
+        tmpdir = self.make_local_path()
+        self.mock_provider.get_chat_conversations.return_value = [
+            {"uuid": "chat1", "project": {"uuid": "proj456"}}
+        ]
+        self.mock_provider.get_chat_conversation.return_value = {
+            "chat_messages": [
+                {
+                    "uuid": "msg1",
+                    "sender": "assistant",
+                    "text": '<antArtifact identifier="page" type="text/html" '
+                    'title="Page"><p>Hi</p></antArtifact>',
+                }
+            ]
+        }
+
+        # The first sync is interrupted after the message files are written
+        with patch(
+            "claudesync.chat_sync.save_artifacts", side_effect=KeyboardInterrupt
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                sync_chats(self.mock_provider, self.mock_config)
+
+        sync_chats(self.mock_provider, self.mock_config)
+
+        artifact_file = os.path.join(
+            tmpdir, "claude_chats", "chat1", "artifacts", "page.html"
+        )
+        with open(artifact_file) as f:
+            self.assertEqual(f.read(), "<p>Hi</p>")
+
+    def test_sync_chats_stops_after_error(self):
+        self.make_local_path(chat_sync_workers=1)
+        self.mock_provider.get_chat_conversations.return_value = [
+            {"uuid": f"chat{i}", "project": {"uuid": "proj456"}} for i in range(20)
+        ]
+        # Chats after the failing one block until the executor is shut down, so
+        # only queued chats that were not cancelled before then can be fetched
+        released = threading.Event()
+
+        class ReleasingExecutor(ThreadPoolExecutor):
+            def __exit__(self, *exc_info):
+                released.set()
+                return super().__exit__(*exc_info)
+
+        def get_chat_conversation(organization_id, chat_id):
+            if chat_id == "chat0":
+                raise ProviderError("Session key has expired")
+            released.wait(5)
+            return {"chat_messages": []}
+
+        self.mock_provider.get_chat_conversation.side_effect = get_chat_conversation
+
+        with patch("claudesync.chat_sync.ThreadPoolExecutor", ReleasingExecutor):
+            with self.assertRaises(ProviderError):
+                sync_chats(self.mock_provider, self.mock_config)
+
+        # Queued chats are cancelled, at most the one already running is fetched
+        self.assertLessEqual(self.mock_provider.get_chat_conversation.call_count, 2)
+
+    def test_sync_chats_durable_flushes_every_file(self):
+        self.make_local_path(chat_sync_durable=True)
+        self.mock_provider.get_chat_conversations.return_value = [
+            {"uuid": "chat1", "project": {"uuid": "proj456"}}
+        ]
+        self.mock_provider.get_chat_conversation.return_value = {
+            "chat_messages": [
+                {"uuid": "msg1", "sender": "human", "text": "Hello"},
+                {
+                    "uuid": "msg2",
+                    "sender": "assistant",
+                    "text": '<antArtifact identifier="page" type="text/html" '
+                    'title="Page"><p>Hi</p></antArtifact>',
+                },
+            ]
+        }
+
+        with patch("claudesync.chat_sync.write_file", wraps=write_file) as mock_write:
+            sync_chats(self.mock_provider, self.mock_config)
+
+        written = [os.path.basename(c.args[0]) for c in mock_write.call_args_list]
+        self.assertEqual(
+            written, ["msg1.json", "msg2.json", "page.html", "metadata.json"]
+        )
+        self.assertTrue(all(c.args[2] for c in mock_write.call_args_list))
+
+    def test_sync_chats_single_messages_file(self):
+        tmpdir = self.make_local_path(
+            chat_messages_single_file=True, chat_sync_durable=True
+        )
+        self.mock_provider.get_chat_conversations.return_value = [
+            {"uuid": "chat1", "project": {"uuid": "proj456"}}
+        ]
+        messages = [
+            {"uuid": "msg1", "sender": "human", "text": "Hello"},
+            {"uuid": "msg2", "sender": "assistant", "text": "Hi"},
+        ]
+        self.mock_provider.get_chat_conversation.return_value = {
+            "chat_messages": messages
+        }
+
+        sync_chats(self.mock_provider, self.mock_config)
+
+        chat_folder = os.path.join(tmpdir, "claude_chats", "chat1")
+        with open(os.path.join(chat_folder, "messages.jsonl")) as f:
+            self.assertEqual([json.loads(line) for line in f], messages)
+        self.assertFalse(os.path.exists(os.path.join(chat_folder, "msg1.json")))
+
     def test_get_file_extension(self):
         self.assertEqual(get_file_extension("text/html"), "html")
         self.assertEqual(get_file_extension("application/vnd.ant.code"), "txt")
@@ -71,6 +71,17 @@ class TestConfigManager(unittest.TestCase):
             saved_config = json.load(f)
         self.assertEqual(saved_config["update_key"], "updated_value")
 
+    @patch("pathlib.Path.home")
+    def test_update_multiple_values(self, mock_home):
+        mock_home.return_value = Path(self.temp_dir)
+        config = ConfigManager()
+        with patch.object(config, "_save_config") as mock_save:
+            config.update({"first_key": "first", "second_key": "second"})
+            mock_save.assert_called_once()
+
+        self.assertEqual(config.get("first_key"), "first")
+        self.assertEqual(config.get("second_key"), "second")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from claudesync.exceptions import ProviderError
+from claudesync.syncmanager import SyncManager
+
+
+class TestSyncManager(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.local_path = self.tmpdir.name
+        self.local_files = {}
+        for i in range(10):
+            file_name = f"file{i}.txt"
+            with open(os.path.join(self.local_path, file_name), "w") as f:
+                f.write(f"Content of file{i}")
+            self.local_files[file_name] = f"hash{i}"
+        self.mock_provider = MagicMock()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_sync_manager(self, **settings):
+        config = {
+            "active_organization_id": "org1",
+            "active_project_id": "proj1",
+            "local_path": self.local_path,
+            "upload_delay": 0,
+            **settings,
+        }
+        return SyncManager(self.mock_provider, config)
+
+    def test_sync_uploads_new_files(self):
+        self.make_sync_manager().sync(self.local_files, [])
+
+        self.assertEqual(self.mock_provider.upload_file.call_count, 10)
+        self.mock_provider.upload_file.assert_any_call(
+            "org1", "proj1", "file0.txt", "Content of file0"
+        )
+
+    def test_sync_uploads_in_parallel(self):
+        # Both uploads must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        self.mock_provider.upload_file.side_effect = lambda *args: barrier.wait()
+        local_files = {
+            name: self.local_files[name] for name in ("file0.txt", "file1.txt")
+        }
+
+        self.make_sync_manager(upload_parallelism=2).sync(local_files, [])
+
+        self.assertEqual(self.mock_provider.upload_file.call_count, 2)
+
+    def test_sync_stops_uploading_after_error(self):
+        # Uploads after the failing one block until the executor is shut down, so
+        # only queued uploads that were not cancelled before then can run
+        released = threading.Event()
+
+        class ReleasingExecutor(ThreadPoolExecutor):
+            def __exit__(self, *exc_info):
+                released.set()
+                return super().__exit__(*exc_info)
+
+        def upload_file(organization_id, project_id, file_name, content):
+            if file_name == "file0.txt":
+                raise ProviderError("Upload failed")
+            released.wait(5)
+
+        self.mock_provider.upload_file.side_effect = upload_file
+
+        with patch("claudesync.syncmanager.ThreadPoolExecutor", ReleasingExecutor):
+            with self.assertRaises(ProviderError):
+                self.make_sync_manager().sync(self.local_files, [])
+
+        # Queued uploads are cancelled, at most the one already running completes
+        self.assertLessEqual(self.mock_provider.upload_file.call_count, 2)
+        self.mock_provider.delete_file.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,31 @@
 import unittest
 import os
 import tempfile
+import time
+from unittest.mock import MagicMock, patch
 
 from claudesync.utils import (
     compute_md5_hash,
     load_gitignore,
     get_local_files,
     load_claudeignore,
+    load_manifest,
+    save_manifest,
+    validate_and_get_provider,
 )
 
 
 class TestUtils(unittest.TestCase):
 
+    def setUp(self):
+        # Keep file manifests out of the real configuration directory
+        manifest_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(manifest_dir.cleanup)
+        self.manifest_dir = manifest_dir.name
+        patcher = patch("claudesync.utils.MANIFEST_DIR", self.manifest_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_calculate_checksum(self):
         content = "Hello, World!"
         expected_checksum = "65a8e27d8879283831b664bd8b7f0ad4"
@@ -100,6 +114,87 @@ class TestUtils(unittest.TestCase):
             self.assertNotIn("file2.log", local_files)
             self.assertNotIn(os.path.join("build", "output.txt"), local_files)
 
+    def test_get_local_files_uses_manifest(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "file1.txt")
+            with open(file_path, "w") as f:
+                f.write("Content of file1")
+            an_hour_ago = time.time() - 3600
+            os.utime(file_path, (an_hour_ago, an_hour_ago))
+
+            self.assertEqual(
+                get_local_files(tmpdir),
+                {"file1.txt": compute_md5_hash("Content of file1")},
+            )
+            manifest = load_manifest(tmpdir)
+            self.assertIn("file1.txt", manifest)
+            # Nothing is written into the synchronized directory
+            self.assertEqual(os.listdir(tmpdir), ["file1.txt"])
+
+            # An unchanged file is not opened again
+            manifest["file1.txt"][2] = "cached"
+            save_manifest(tmpdir, manifest, time.time_ns())
+            with patch("claudesync.utils.is_text_file") as mock_is_text_file, patch(
+                "claudesync.utils.process_file"
+            ) as mock_process_file:
+                self.assertEqual(get_local_files(tmpdir), {"file1.txt": "cached"})
+            mock_is_text_file.assert_not_called()
+            mock_process_file.assert_not_called()
+
+            # A modified file is
+            with open(file_path, "w") as f:
+                f.write("New content of file1")
+            self.assertEqual(
+                get_local_files(tmpdir),
+                {"file1.txt": compute_md5_hash("New content of file1")},
+            )
+
+    def test_get_local_files_rehashes_recently_modified_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "file1.txt")
+            with open(file_path, "w") as f:
+                f.write("Content A")
+            get_local_files(tmpdir)
+
+            # A same-size edit within the mtime resolution keeps size and mtime
+            mtime_ns = os.stat(file_path).st_mtime_ns
+            with open(file_path, "w") as f:
+                f.write("Content B")
+            os.utime(file_path, ns=(mtime_ns, mtime_ns))
+
+            self.assertEqual(
+                get_local_files(tmpdir), {"file1.txt": compute_md5_hash("Content B")}
+            )
+
+    @patch("claudesync.utils._providers", {})
+    def test_save_manifest_keeps_previous_manifest_on_failure(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest = {"file1.txt": [1, 0, "hash1"]}
+            save_manifest(tmpdir, manifest, time.time_ns())
+
+            with patch("claudesync.utils.os.replace", side_effect=OSError("disk full")):
+                save_manifest(tmpdir, {"file1.txt": [2, 0, "hash2"]}, time.time_ns())
+
+            self.assertEqual(load_manifest(tmpdir), manifest)
+            # No temporary file is left behind
+            self.assertEqual(len(os.listdir(self.manifest_dir)), 1)
+
+    @patch("claudesync.utils.get_provider")
+    def test_validate_and_get_provider_reuses_instance(self, mock_get_provider):
+        settings = {"active_provider": "claude.ai", "active_organization_id": "org1"}
+        config = MagicMock()
+        config.get.side_effect = settings.get
+        config.get_session_key.return_value = "sk-ant-test"
+
+        provider = validate_and_get_provider(config)
+        self.assertIs(validate_and_get_provider(config), provider)
+        mock_get_provider.assert_called_once_with("claude.ai", "sk-ant-test", None)
+
+        # A new session key gets a new provider
+        config.get_session_key.return_value = "sk-ant-other"
+        validate_and_get_provider(config)
+        self.assertEqual(mock_get_provider.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()